@@ -16,17 +16,20 @@ class TestConfig:
     BROWSER_HEADLESS = False
 
     SCREENSHOT_DIR = Path("screenshots")
-
-    PARKING_PROBABILITY = 0.3
-    CAR_SHARING_PROBABILITY = 0.2
-    MOTORBIKE_PROBABILITY = 0.1
-    BIKE_PARKING_PROBABILITY = 0.7
-    ADDITIONAL_ROOM_PROBABILITY = 0.25
-    STORAGE_ROOM_PROBABILITY = 0.4
-    WORKSHOP_PROBABILITY = 0.15
-    COWORKING_PROBABILITY = 0.25
-    HOME_OFFICE_PROBABILITY = 0.6
-    ACCESSIBILITY_PROBABILITY = 0.05
+    DEBUG_DIAGNOSTICS = False
+
+    PROBABILITIES = {
+        "parking": 0.3,
+        "car_sharing": 0.2,
+        "motorbike": 0.1,
+        "bike_parking": 0.7,
+        "additional_room": 0.25,
+        "storage_room": 0.4,
+        "workshop": 0.15,
+        "coworking": 0.25,
+        "home_office": 0.6,
+        "accessibility": 0.05,
+    }
 
 
 class Selectors:
@@ -69,7 +72,10 @@ class Selectors:
 
     FIRST_NAME_INPUT = "#field-firstname"
 
-    APARTMENT_ROWS = [
+    # APARTMENT_ROWS, APPLY_BUTTONS and START_BUTTONS are tried one selector at a
+    # time and the first visible hit wins, so their order is their priority.
+    # Groups with a *_CSS join are any-match checks where order has no effect.
+    APARTMENT_ROWS = (
         "tr[data-apartment-id]",
         "tr:has(td:has-text('Available'))",
         "tr:has(.bewerben)",
@@ -77,59 +83,61 @@ class Selectors:
         "table tr:not(:first-child)",
         ".apartment-row",
         "tr:has(td):not(.header-row)"
-    ]
+    )
     
-    WISHLIST_BUTTONS = [
-        "span.bewerben:has-text('Wishlist')",
-        "span.bewerben",
-        "span:has-text('Wishlist')",
+    WISHLIST_BUTTONS = (
+        "[data-action='wishlist']",
         ".wishlist-btn",
-        "[data-action='wishlist']"
-    ]
+        "span.bewerben",
+        "span:has-text('Wishlist')"
+    )
     
-    WISHLIST_PANEL = [
+    WISHLIST_PANEL = (
         ".apartments-table-wishlist",
         "[data-v-21a4b90e].apartments-table-wishlist",
         "div[class*='apartments-table-wishlist']"
-    ]
+    )
+    WISHLIST_PANEL_CSS = ", ".join(WISHLIST_PANEL)
 
-    APPLY_BUTTONS = [
-        ".button:has-text('Apply')",
-        "[data-v-21a4b90e].button:has-text('Apply')",
+    APPLY_BUTTONS = (
         "div.button:has-text('Apply')",
+        ".button:has-text('Apply')",
         "button:has-text('Apply')",
         "*[class*='button']:has-text('Apply')"
-    ]
+    )
     
     FORM_CONTAINER = ".application-form"
     SUBMIT_BUTTON = "div#application-btn-submit"
     
-    FORM_INDICATORS = [
+    FORM_INDICATORS = (
         ".application-form",
+        ".af-steps",
         "form",
         "input[type='text']",
         "textarea",
-        "select",
-        ".af-steps"
-    ]
+        "select"
+    )
+    FORM_INDICATORS_CSS = ", ".join(FORM_INDICATORS)
     
-    START_BUTTONS = [
+    START_BUTTONS = (
         "#start-application-btn",
-        "button:has-text('Start')",
         ".start-btn",
+        ".begin-application",
         "input[type='submit']",
-        ".begin-application"
-    ]
+        "button:has-text('Start')"
+    )
 
-    ERROR_MESSAGES = [
+    ERROR_MESSAGES = (
         ".error-message",
         ".validation-error",
         ".field-error",
         "[class*='error']"
-    ]
+    )
+    ERROR_MESSAGES_CSS = ", ".join(ERROR_MESSAGES)
     
-    SUCCESS_INDICATORS = [
+    SUCCESS_INDICATORS = (
         "div#apartment_household .af-position.active",
-        "[class*='success']",
-        ".step-completed"
-    ]
\ No newline at end of file
+        ".step-completed",
+        "[class*='success']"
+    )
+    SUCCESS_INDICATORS_CSS = ", ".join(SUCCESS_INDICATORS)
\ No newline at end of file
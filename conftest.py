@@ -1,9 +1,27 @@
 import pytest
 import asyncio
 
+from data.factories import TestDataFactory
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create an instance of the default event loop for the test session."""
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
-    loop.close()
\ No newline at end of file
+    loop.close()
+
+@pytest.fixture(scope="session")
+def family_data():
+    """Random family generated once and shared by every test in the session.
+
+    The PersonData objects are mutable and shared; tests must treat them as read-only.
+    """
+    return TestDataFactory.create_family_for_test_type("smoke")
+
+@pytest.fixture(scope="session")
+def applicant_data():
+    """Random applicant form data generated once and shared by every test in the session.
+
+    The FormData object is mutable and shared; tests must treat it as read-only.
+    """
+    return TestDataFactory.create_realistic_applicant()
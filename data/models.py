@@ -1,8 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
-from enum import Enum
 
-@dataclass
+@dataclass(slots=True)
 class ApartmentDetails:
     """Data model for apartment information"""
     rooms: Optional[str] = None
@@ -12,7 +11,7 @@ class ApartmentDetails:
     full_text: str = ""
     apartment_id: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ParkingRequirements:
     """Parking-related requirements"""
     wants_parking: bool = False
@@ -25,7 +24,7 @@ class ParkingRequirements:
     special_spaces: int = 0
     reason: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class HouseholdData:
     """Household information data structure"""
     household_type: Optional[str] = None
@@ -53,7 +52,7 @@ class HouseholdData:
     object_found_on: Optional[str] = None
     remarks: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class FormData:
     """Complete form data structure"""
     parking: ParkingRequirements = field(default_factory=ParkingRequirements)
@@ -77,16 +76,20 @@ class FormData:
     home_office_reason: Optional[str] = None
     needs_obstacle_free: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """Test execution result"""
     success: bool
     error_message: Optional[str] = None
-    screenshot_paths: list = field(default_factory=list)
+    screenshot_paths: tuple = ()
     apartment_details: Optional[ApartmentDetails] = None
     execution_time: Optional[float] = None
 
-@dataclass
+    def add_screenshot(self, path: str) -> None:
+        """Record a screenshot captured during the test"""
+        self.screenshot_paths += (path,)
+
+@dataclass(slots=True)
 class PersonData:
     """Data model for individual person information"""
     salutation: Optional[str] = None
@@ -1,39 +1,95 @@
+import asyncio
+import json
+import re
 from playwright.async_api import Page
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from config.test_config import TestConfig
 from exceptions.test_exceptions import ApplicationFormError
 from utils.screenshot_manager import ScreenshotManager
 from utils.logging import TestLogger
 from data.models import PersonData, FormData
 
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_DATE_RE = re.compile(r'\b\d{2}\.\d{2}\.\d{4}\b')
+_PHONE_RE = re.compile(r'\b\d{2,3}[-.\s]?\d{3}[-.\s]?\d{2}[-.\s]?\d{2}\b')
+_STATUS_RE = re.compile(
+    "pending|approved|rejected|new|submitted|ausstehend|genehmigt|abgelehnt|neu|eingereicht",
+    re.IGNORECASE
+)
+_LABEL_PATTERNS = tuple(
+    (label, tuple(re.compile(rf'{pattern}:?\s*([^\n\r]+)', re.IGNORECASE) for pattern in patterns))
+    for label, patterns in (
+        ("Email", ("email", "e-mail", "@")),
+        ("Phone", ("phone", "tel", "mobile")),
+        ("Address", ("address", "street", "strasse")),
+        ("Move-in", ("move-in", "move in", "einzug")),
+        ("Date", ("date", "datum")),
+        ("Status", ("status", "state")),
+    )
+)
+
 class AdminApplicationsPage:
     """Page Object Model for admin applications management functionality"""
+
+    NAVIGATION_SELECTORS = (
+        "a[href='/applications']:visible",
+        ".menu-item-label:has-text('Applications'):visible",
+        ":text('Applications'):visible",
+        "span:has-text('Applications'):visible"
+    )
+
+    PAGE_INDICATORS = (
+        "table", ".table",
+        "[data-testid*='applications']", "[data-testid*='bewerbungen']",
+        "th:has-text('Name')", "th:has-text('Email')", "th:has-text('Status')",
+        ":text('Bewerbungen')", ":text('Applications')"
+    )
+    PAGE_INDICATORS_CSS = ", ".join(f"{selector}:visible" for selector in PAGE_INDICATORS)
+
+    TABLE_SELECTORS = ("table", ".table", "[role='table']", ".applications-table", ".bewerbungen-table")
+    TABLE_SELECTORS_CSS = ", ".join(f"{selector}:visible" for selector in TABLE_SELECTORS)
+
+    CONTENT_SELECTORS = (":text('Bewerbungen')", ":text('Applications')", "tr", "td", "th", ".content", ".main-content")
+    CONTENT_SELECTORS_CSS = ", ".join(f"{selector}:visible" for selector in CONTENT_SELECTORS)
+
+    # Per-attempt bound for row clicks so a failing strategy hands over quickly
+    # instead of running out Playwright's default 30s actionability wait.
+    CLICK_TIMEOUT = 3000
     
-    def __init__(self, page: Page, screenshot_manager: ScreenshotManager, logger: TestLogger):
+    def __init__(self, page: Page, screenshot_manager: ScreenshotManager, logger: TestLogger,
+                 debug_enabled: bool = TestConfig.DEBUG_DIAGNOSTICS):
         self.page = page
         self.screenshot_manager = screenshot_manager
         self.logger = logger
+        self.debug_enabled = debug_enabled
         self.applications_url = "https://mostar.demo.ch.melon.market/applications"
+        self._last_found_row: Optional[Tuple[str, Any]] = None
+    
+    def _diagnostics_enabled(self) -> bool:
+        """Whether the verbose page and table diagnostics should run"""
+        return self.debug_enabled or self.logger.is_debug_enabled()
+    
+    def _is_applications_url(self) -> bool:
+        """Whether the current URL already points at the applications list"""
+        current_url = self.page.url
+        return "/applications" in current_url or "/bewerbungen" in current_url
     
     async def navigate_to_applications(self) -> None:
         """Navigate to the applications page from admin dashboard"""
         self.logger.info(f"Navigating to applications page: {self.applications_url}")
+        self._last_found_row = None
         
         try:
             await self._try_navigation_menu()
 
-            current_url = self.page.url
-            if "/applications" not in current_url:
+            if not self._is_applications_url():
                 self.logger.info("Navigation menu not found, trying direct URL navigation")
-                await self.page.goto(self.applications_url)
+                await self.page.goto(self.applications_url, wait_until="domcontentloaded")
 
             try:
-                await self.page.wait_for_load_state('domcontentloaded', timeout=15000)
-                self.logger.info("Page domcontentloaded state reached")
-            except:
-                self.logger.warning("domcontentloaded timeout, but continuing...")
-
-            await self.page.wait_for_timeout(3000)
+                await self.page.wait_for_selector(self.TABLE_SELECTORS_CSS, timeout=15000)
+            except Exception:
+                self.logger.warning("Applications table not visible yet, but continuing...")
             
             await self.screenshot_manager.capture(self.page, "11_applications_page", full_page=True)
             
@@ -50,34 +106,25 @@ class AdminApplicationsPage:
         """Try to navigate using the admin menu/navigation"""
         self.logger.info("Attempting navigation via admin menu...")
 
-        navigation_selectors = [
-            "a[href='/applications']",
-            "a[href='/applications'].menu-item-parent",
-            "div.menu-item a[href='/applications']",
-            ".menu-item a[href='/applications']",
-            ".menu-item-label:has-text('Applications')",
-            "span.menu-item-label:has-text('Applications')",
-            "text=Applications",
-            "span:has-text('Applications')"
-        ]
-        
-        for selector in navigation_selectors:
+        for selector in self.NAVIGATION_SELECTORS:
             try:
                 self.logger.info(f"Trying selector: {selector}")
-                element = await self.page.wait_for_selector(selector, timeout=3000)
-                if element and await element.is_visible():
-                    self.logger.info(f"Found visible element with selector: {selector}")
-                    await element.click()
-                    self.logger.info(f"Successfully clicked navigation element: {selector}")
-                    await self.page.wait_for_timeout(2000)
+                element = self.page.locator(selector).first
+                await element.wait_for(state="visible", timeout=3000)
+                await element.click()
+                self.logger.info(f"Successfully clicked navigation element: {selector}")
+                try:
+                    await self.page.wait_for_url("**/applications**", timeout=3000)
+                except Exception:
+                    pass
+                
+                current_url = self.page.url
+                if "/applications" in current_url:
+                    self.logger.info(f"Navigation successful: {current_url}")
+                    return
+                else:
+                    self.logger.info(f"Click succeeded but URL unchanged: {current_url}")
                     
-                    current_url = self.page.url
-                    if "/applications" in current_url:
-                        self.logger.info(f"Navigation successful: {current_url}")
-                        return
-                    else:
-                        self.logger.info(f"Click succeeded but URL unchanged: {current_url}")
-                        
             except Exception as e:
                 self.logger.info(f"Selector failed: {selector} - {e}")
                 continue
@@ -85,34 +132,30 @@ class AdminApplicationsPage:
         self.logger.info("CSS selectors failed, trying JavaScript approach...")
         try:
             await self.page.evaluate("""
-                const appointmentLinks = document.querySelectorAll('a[href="/viewing-appointments"]');
-                if (appointmentLinks.length > 0) {
-                    console.log('Found Appointments link, clicking...');
-                    appointmentLinks[0].click();
-                    return;
-                }
-                
-                const appLinks = document.querySelectorAll('a[href="/applications"]');
-                if (appLinks.length > 0) {
-                    console.log('Found Applications link, clicking...');
-                    appLinks[0].click();
-                    return;
-                }
-                
-                const allElements = document.querySelectorAll('*');
-                for (const el of allElements) {
-                    if (el.textContent && (el.textContent.trim() === 'Appointments' || el.textContent.trim() === 'Applications')) {
-                        const clickableParent = el.closest('a, button, [onclick]');
-                        if (clickableParent) {
-                            console.log('Found text, clicking parent...');
-                            clickableParent.click();
-                            return;
-                        }
+                () => {
+                    const link = document.querySelector('a[href="/viewing-appointments"]')
+                        || document.querySelector('a[href="/applications"]');
+                    if (link) {
+                        link.click();
+                        return;
+                    }
+                    
+                    const labelled = document.evaluate(
+                        "(//a | //button | //*[@onclick])[normalize-space(.)='Appointments' or normalize-space(.)='Applications']",
+                        document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+                    ).singleNodeValue;
+                    if (labelled) {
+                        labelled.click();
                     }
                 }
             """)
             
-            await self.page.wait_for_timeout(2000)
+            try:
+                await self.page.wait_for_url(
+                    lambda url: "/viewing-appointments" in url or "/applications" in url, timeout=3000
+                )
+            except Exception:
+                pass
             current_url = self.page.url
             if "/viewing-appointments" in current_url or "/applications" in current_url:
                 self.logger.info("JavaScript navigation succeeded")
@@ -128,36 +171,15 @@ class AdminApplicationsPage:
         self.logger.info("Verifying applications page loaded...")
         
         try:
-            current_url = self.page.url
-            if "/applications" in current_url or "/bewerbungen" in current_url:
+            if self._is_applications_url():
                 self.logger.info("URL indicates applications page loaded")
                 return True
             
-            page_indicators = [
-                "text=Bewerbungen",
-                "text=Applications", 
-                "table",
-                ".table",
-                "[data-testid*='applications']",
-                "[data-testid*='bewerbungen']",
-                "th:has-text('Name')",
-                "th:has-text('Email')",
-                "th:has-text('Status')"
-            ]
-            
-            found_indicators = 0
-            for selector in page_indicators:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=3000)
-                    found_indicators += 1
-                    self.logger.info(f"Found applications page indicator: {selector}")
-                except:
-                    continue
-            
-            if found_indicators >= 1:
+            try:
+                await self.page.wait_for_selector(self.PAGE_INDICATORS_CSS, timeout=3000)
                 self.logger.info("Applications page verified successfully")
                 return True
-            else:
+            except Exception:
                 self.logger.error("Applications page indicators not found")
                 await self._debug_applications_page()
                 return False
@@ -196,6 +218,7 @@ class AdminApplicationsPage:
                 return verification_results
             
             table_row = await self._find_applicant_row(main_applicant)
+            self._last_found_row = (main_applicant.email, table_row) if table_row else None
             if not table_row:
                 verification_results["errors"].append("Applicant not found in applications table")
                 self.logger.warning("Applicant not found in applications table")
@@ -228,40 +251,21 @@ class AdminApplicationsPage:
         """Wait for the applications table to load"""
         self.logger.info("Waiting for applications table to load...")
         
-        table_selectors = [
-            "table",
-            ".table",
-            "[role='table']",
-            ".applications-table",
-            ".bewerbungen-table"
-        ]
-        
         table_found = False
-        for selector in table_selectors:
-            try:
-                await self.page.wait_for_selector(selector, timeout=15000)
-                table_found = True
-                self.logger.info(f"Applications table found with selector: {selector}")
-                break
-            except:
-                continue
+        try:
+            await self.page.wait_for_selector(self.TABLE_SELECTORS_CSS, timeout=15000)
+            table_found = True
+            self.logger.info("Applications table found")
+        except Exception:
+            pass
         
         if not table_found:
-            content_selectors = [
-                "text=Bewerbungen",
-                "text=Applications", 
-                "tr", "td", "th",
-                ".content", ".main-content"
-            ]
-            
-            for selector in content_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    self.logger.info(f"Found page content with selector: {selector}")
-                    table_found = True
-                    break
-                except:
-                    continue
+            try:
+                await self.page.wait_for_selector(self.CONTENT_SELECTORS_CSS, timeout=5000)
+                self.logger.info("Found applications page content")
+                table_found = True
+            except Exception:
+                pass
         
         if not table_found:
             self.logger.warning("No table found, but continuing with verification attempt...")
@@ -275,10 +279,9 @@ class AdminApplicationsPage:
                 (element) => {
                     element.style.border = '3px solid red';
                     element.style.backgroundColor = '#ffebee';
-                    element.scrollIntoView({behavior: 'smooth', block: 'center'});
+                    element.scrollIntoView({behavior: 'instant', block: 'center'});
                 }
             """)
-            await self.page.wait_for_timeout(2000)
             self.logger.info("Added red border around found applicant row")
         except Exception as e:
             self.logger.error(f"Error highlighting row: {e}")
@@ -287,57 +290,58 @@ class AdminApplicationsPage:
         """Find the table row containing the main applicant"""
         self.logger.info(f"Looking for applicant: {main_applicant.first_name} {main_applicant.last_name}")
 
-        search_strategies = [
-            f"tr:has-text('{main_applicant.first_name} {main_applicant.last_name}')",
-            f"tr:has-text('{main_applicant.last_name}, {main_applicant.first_name}')",
-            f"tr:has-text('{main_applicant.email}')",
-            f"tr:has-text('{main_applicant.last_name}')",
-            f"tr:has-text('{main_applicant.first_name}')"
-        ]
-        
-        for strategy in search_strategies:
-            try:
-                rows = await self.page.query_selector_all(strategy)
-                if rows:
-                    self.logger.info(f"Found {len(rows)} potential matches with strategy: {strategy}")
-                    found_row = rows[0]
-                
-                    await self.highlight_found_row(found_row)
-                    
-                    return found_row
-            except Exception as e:
-                self.logger.debug(f"Strategy failed: {strategy} - {e}")
+        search_strategies = (
+            f"tr:has-text({json.dumps(main_applicant.email, ensure_ascii=False)})",
+            f"tr:has-text({json.dumps(f'{main_applicant.first_name} {main_applicant.last_name}', ensure_ascii=False)})",
+        )
+        results = await asyncio.gather(
+            *(self.page.query_selector_all(strategy) for strategy in search_strategies),
+            return_exceptions=True
+        )
+        
+        for strategy, rows in zip(search_strategies, results):
+            if isinstance(rows, Exception):
+                self.logger.debug(f"Strategy failed: {strategy} - {rows}")
                 continue
+            if rows:
+                self.logger.info(f"Found {len(rows)} potential matches with strategy: {strategy}")
+                found_row = rows[0]
+                
+                await self.highlight_found_row(found_row)
+                
+                return found_row
 
         self.logger.info("Trying manual search through all table rows...")
-        found_row = await self._manual_row_search(main_applicant)
-
-        if found_row:
-            await self.highlight_found_row(found_row)
-        
-        return found_row
+        return await self._manual_row_search(main_applicant)
 
     
     async def _manual_row_search(self, main_applicant: PersonData) -> Optional[Any]:
         """Manually search through table rows when selectors fail"""
         try:
-            rows = await self.page.query_selector_all("tr")
-            self.logger.info(f"Searching through {len(rows)} table rows manually")
-            
-            for row in rows:
-                try:
-                    row_text = await row.text_content()
-                    if row_text and (
-                        main_applicant.last_name.lower() in row_text.lower() or
-                        main_applicant.email.lower() in row_text.lower() or
-                        (main_applicant.first_name.lower() in row_text.lower() and 
-                         main_applicant.last_name.lower() in row_text.lower())
-                    ):
-                        self.logger.info(f"Found matching row with text: {row_text[:100]}...")
-                        return row
-                except:
-                    continue
-            
+            last_name = main_applicant.last_name.lower()
+            email = main_applicant.email.lower()
+            handle = await self.page.evaluate_handle("""
+                ({lastName, email}) => {
+                    const rows = document.querySelectorAll('tr');
+                    for (let i = 0; i < rows.length; i++) {
+                        const text = (rows[i].textContent || '').toLowerCase();
+                        if (text.includes(lastName) || text.includes(email)) {
+                            rows[i].style.border = '3px solid red';
+                            rows[i].style.backgroundColor = '#ffebee';
+                            rows[i].scrollIntoView({behavior: 'instant', block: 'center'});
+                            return rows[i];
+                        }
+                    }
+                    return null;
+                }
+            """, {"lastName": last_name, "email": email})
+            row = handle.as_element()
+            if row:
+                row_text = await row.text_content() or ""
+                self.logger.info(f"Found matching row with text: {row_text[:100]}...")
+                return row
+            
+            await handle.dispose()
             self.logger.warning("No matching rows found in manual search")
             return None
             
@@ -351,18 +355,17 @@ class AdminApplicationsPage:
         
         row_data = {}
         try:
-            cells = await table_row.query_selector_all("td, th")
-            
-            row_text = await table_row.text_content()
-            row_data["full_row_text"] = row_text.strip() if row_text else ""
+            texts = await table_row.evaluate("""
+                (element) => ({
+                    full: (element.textContent || '').trim(),
+                    cells: Array.from(element.querySelectorAll('td, th'), cell => (cell.textContent || '').trim())
+                })
+            """)
+            row_data["full_row_text"] = texts["full"]
             
-            for i, cell in enumerate(cells):
-                try:
-                    cell_text = await cell.text_content()
-                    if cell_text and cell_text.strip():
-                        row_data[f"cell_{i}"] = cell_text.strip()
-                except:
-                    continue
+            for i, cell_text in enumerate(texts["cells"]):
+                if cell_text:
+                    row_data[f"cell_{i}"] = cell_text
             
             await self._identify_column_data(table_row, row_data)
             
@@ -379,22 +382,17 @@ class AdminApplicationsPage:
         try:
             full_text = row_data.get("full_row_text", "")
 
-            import re
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            email_matches = re.findall(email_pattern, full_text)
-            if email_matches:
-                row_data["email"] = email_matches[0]
+            email_match = _EMAIL_RE.search(full_text)
+            if email_match:
+                row_data["email"] = email_match.group(0)
             
-            date_pattern = r'\b\d{2}\.\d{2}\.\d{4}\b'
-            date_matches = re.findall(date_pattern, full_text)
+            date_matches = _DATE_RE.findall(full_text)
             if date_matches:
                 row_data["dates_found"] = date_matches
 
-            status_keywords = ["pending", "approved", "rejected", "new", "submitted", "ausstehend", "genehmigt", "abgelehnt", "neu", "eingereicht"]
-            for keyword in status_keywords:
-                if keyword.lower() in full_text.lower():
-                    row_data["status_indicator"] = keyword
-                    break
+            status_match = _STATUS_RE.search(full_text)
+            if status_match:
+                row_data["status_indicator"] = status_match.group(0).lower()
             
         except Exception as e:
             self.logger.debug(f"Error identifying column data: {e}")
@@ -412,12 +410,15 @@ class AdminApplicationsPage:
         
         try:
             full_text = row_data.get("full_row_text", "").lower()
+            first_name = main_applicant.first_name.lower()
+            last_name = main_applicant.last_name.lower()
+            email = main_applicant.email.lower()
 
             name_variants = [
-                f"{main_applicant.first_name} {main_applicant.last_name}".lower(),
-                f"{main_applicant.last_name}, {main_applicant.first_name}".lower(),
-                f"{main_applicant.last_name}".lower(),
-                f"{main_applicant.first_name}".lower()
+                f"{first_name} {last_name}",
+                f"{last_name}, {first_name}",
+                last_name,
+                first_name
             ]
             
             for name_variant in name_variants:
@@ -426,7 +427,7 @@ class AdminApplicationsPage:
                     self.logger.info(f"Name verified: {name_variant}")
                     break
 
-            if main_applicant.email.lower() in full_text:
+            if email in full_text:
                 verification["email_found"] = True
                 self.logger.info("Email verified in table")
 
@@ -468,30 +469,21 @@ class AdminApplicationsPage:
         
         try:
             await self._wait_for_applications_table()
-            
 
-            headers = await self.page.query_selector_all("th")
-            for header in headers:
-                try:
-                    header_text = await header.text_content()
-                    if header_text and header_text.strip():
-                        summary["table_headers"].append(header_text.strip())
-                except:
-                    continue
-            
-            rows = await self.page.query_selector_all("tbody tr, table tr:not(:first-child)")
-            summary["total_applications"] = len(rows)
-
-            for i, row in enumerate(rows[:5]):
-                try:
-                    row_text = await row.text_content()
-                    if row_text and row_text.strip():
-                        summary["sample_rows"].append({
-                            "row_index": i,
-                            "row_text": row_text.strip()[:200]
-                        })
-                except:
-                    continue
+            table = await self.page.evaluate("""
+                () => {
+                    const headers = Array.from(document.querySelectorAll('th'), h => (h.textContent || '').trim())
+                        .filter(Boolean);
+                    const rows = document.querySelectorAll('tbody tr, table tr:not(:first-child)');
+                    const sample = Array.from(rows).slice(0, 5)
+                        .map((r, i) => ({row_index: i, row_text: (r.textContent || '').trim().slice(0, 200)}))
+                        .filter(r => r.row_text);
+                    return {total: rows.length, headers, sample};
+                }
+            """)
+            summary["total_applications"] = table["total"]
+            summary["table_headers"] = table["headers"]
+            summary["sample_rows"] = table["sample"]
             
             self.logger.info(f"Table summary: {summary['total_applications']} applications found")
             return summary
@@ -503,6 +495,10 @@ class AdminApplicationsPage:
     
     async def _debug_applications_page(self) -> None:
         """Debug what's currently on the applications page"""
+        if not self._diagnostics_enabled():
+            await self.screenshot_manager.capture_error(self.page, "applications_page_debug")
+            return
+        
         self.logger.info("=== DEBUGGING APPLICATIONS PAGE STATE ===")
         
         try:
@@ -542,32 +538,39 @@ class AdminApplicationsPage:
     
     async def _debug_table_contents(self) -> None:
         """Debug what's actually in the applications table"""
+        if not self._diagnostics_enabled():
+            return
+        
         self.logger.info("=== DEBUGGING TABLE CONTENTS ===")
         
         try:
-            rows = await self.page.query_selector_all("tr")
-            self.logger.info(f"Found {len(rows)} table rows total")
+            table = await self.page.evaluate("""
+                () => {
+                    const rows = document.querySelectorAll('tr');
+                    return {
+                        total: rows.length,
+                        sample: Array.from(rows).slice(0, 10).map(r => (r.textContent || '').trim()),
+                        text: Array.from(document.querySelectorAll('table'), t => t.textContent || '').join('\\n')
+                    };
+                }
+            """)
+            self.logger.info(f"Found {table['total']} table rows total")
             
-            for i, row in enumerate(rows[:10]):
-                try:
-                    row_text = await row.text_content()
-                    if row_text and row_text.strip():
-                        self.logger.info(f"Row {i}: {row_text.strip()[:150]}")
-                except:
-                    continue
+            for i, row_text in enumerate(table["sample"]):
+                if row_text:
+                    self.logger.info(f"Row {i}: {row_text[:150]}")
 
-            page_text = await self.page.text_content("body")
-            if page_text:
-                import re
-                email_matches = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', page_text)
+            table_text = table["text"]
+            if table_text:
+                email_matches = _EMAIL_RE.findall(table_text)
                 if email_matches:
-                    self.logger.info(f"Found emails on page: {email_matches[:5]}")
+                    self.logger.info(f"Found emails in table: {email_matches[:5]}")
                 
-
+                table_text = table_text.lower()
                 name_patterns = ["TestFamily", "John", "Sarah", "Emma"]
                 for pattern in name_patterns:
-                    if pattern.lower() in page_text.lower():
-                        self.logger.info(f"Found name pattern '{pattern}' on page")
+                    if pattern.lower() in table_text:
+                        self.logger.info(f"Found name pattern '{pattern}' in table")
             
         except Exception as e:
             self.logger.error(f"Error debugging table contents: {e}")
@@ -608,7 +611,10 @@ class AdminApplicationsPage:
                 verification_results["errors"].append("No main applicant data provided")
                 return verification_results
             
-            table_row = await self._find_applicant_row(main_applicant)
+            if self._last_found_row and self._last_found_row[0] == main_applicant.email:
+                table_row = self._last_found_row[1]
+            else:
+                table_row = await self._find_applicant_row(main_applicant)
             if table_row:
                 await self._click_table_row(table_row)
                 verification_results["row_clicked"] = True
@@ -642,7 +648,7 @@ class AdminApplicationsPage:
         
         try:
             click_strategies = [
-                lambda: table_row.click(),
+                lambda: table_row.click(timeout=self.CLICK_TIMEOUT),
 
                 lambda: self._click_first_clickable_cell(table_row),
 
@@ -652,6 +658,7 @@ class AdminApplicationsPage:
             for i, strategy in enumerate(click_strategies):
                 try:
                     await strategy()
+                    self._last_found_row = None
                     self.logger.info(f"Successfully clicked row using strategy {i+1}")
                     await self.page.wait_for_timeout(2000)
                     return
@@ -660,7 +667,8 @@ class AdminApplicationsPage:
                     continue
             
             try:
-                await table_row.dblclick()
+                await table_row.dblclick(timeout=self.CLICK_TIMEOUT)
+                self._last_found_row = None
                 self.logger.info("Successfully double-clicked row")
                 await self.page.wait_for_timeout(2000)
             except Exception as e:
@@ -678,15 +686,15 @@ class AdminApplicationsPage:
             try:
                 links = await cell.query_selector_all("a, button, [onclick]")
                 if links:
-                    await links[0].click()
+                    await links[0].click(timeout=self.CLICK_TIMEOUT)
                     return
                 
-                await cell.click()
+                await cell.click(timeout=self.CLICK_TIMEOUT)
                 return
             except:
                 continue
 
-        await table_row.click()
+        await table_row.click(timeout=self.CLICK_TIMEOUT)
 
     async def _click_row_action_element(self, table_row) -> None:
         """Click a specific action element in the row (link, button, etc.)"""
@@ -704,13 +712,13 @@ class AdminApplicationsPage:
             try:
                 element = await table_row.query_selector(selector)
                 if element and await element.is_visible():
-                    await element.click()
+                    await element.click(timeout=self.CLICK_TIMEOUT)
                     self.logger.info(f"Clicked row element: {selector}")
                     return
             except:
                 continue
 
-        await table_row.click()
+        await table_row.click(timeout=self.CLICK_TIMEOUT)
 
     async def _wait_for_detail_view(self) -> bool:
         """Wait for detail view/modal to load after clicking row"""
@@ -777,19 +785,15 @@ class AdminApplicationsPage:
             page_text = await self.page.text_content("body")
             detail_data["full_page_text"] = page_text[:1000] if page_text else ""
             
-            import re
-            email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-            email_matches = re.findall(email_pattern, page_text) if page_text else []
+            email_matches = _EMAIL_RE.findall(page_text) if page_text else []
             if email_matches:
                 detail_data["emails_found"] = email_matches
             
-            phone_pattern = r'\b\d{2,3}[-.\s]?\d{3}[-.\s]?\d{2}[-.\s]?\d{2}\b'
-            phone_matches = re.findall(phone_pattern, page_text) if page_text else []
+            phone_matches = _PHONE_RE.findall(page_text) if page_text else []
             if phone_matches:
                 detail_data["phones_found"] = phone_matches
             
-            date_pattern = r'\b\d{2}\.\d{2}\.\d{4}\b'
-            date_matches = re.findall(date_pattern, page_text) if page_text else []
+            date_matches = _DATE_RE.findall(page_text) if page_text else []
             if date_matches:
                 detail_data["dates_found"] = date_matches
             
@@ -842,26 +846,15 @@ class AdminApplicationsPage:
         labeled_data = {}
         
         try:
-            label_patterns = [
-                ("Email", ["email", "e-mail", "@"]),
-                ("Phone", ["phone", "tel", "mobile"]),
-                ("Address", ["address", "street", "strasse"]),
-                ("Move-in", ["move-in", "move in", "einzug"]),
-                ("Date", ["date", "datum"]),
-                ("Status", ["status", "state"]),
-            ]
-            
             page_text = await self.page.text_content("body")
             if not page_text:
                 return labeled_data
             
-            for label, patterns in label_patterns:
-                for pattern in patterns:
-                    import re
-                    pattern_regex = rf'{pattern}:?\s*([^\n\r]+)'
-                    matches = re.findall(pattern_regex, page_text, re.IGNORECASE)
-                    if matches:
-                        labeled_data[f"{label.lower()}_from_text"] = matches[0].strip()
+            for label, patterns in _LABEL_PATTERNS:
+                for pattern_regex in patterns:
+                    match = pattern_regex.search(page_text)
+                    if match:
+                        labeled_data[f"{label.lower()}_from_text"] = match.group(1).strip()
                         break
         
         except Exception as e:
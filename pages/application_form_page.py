@@ -82,18 +82,9 @@ class ApplicationFormPage:
             current_url = self.page.url
             self.logger.info(f"Current URL: {current_url}")
             
-            found_indicators = []
-            for indicator in Selectors.FORM_INDICATORS:
-                try:
-                    element = await self.page.query_selector(indicator)
-                    if element:
-                        found_indicators.append(indicator)
-                except:
-                    continue
+            form_indicator = await self.page.query_selector(Selectors.FORM_INDICATORS_CSS)
             
-            self.logger.info(f"Form indicators found: {found_indicators}")
-            
-            if found_indicators:
+            if form_indicator:
                 self.logger.info("Application form verified")
                 return True
             else:
@@ -330,14 +321,13 @@ class ApplicationFormPage:
             if has_errors:
                 return False
             
-            for indicator in Selectors.SUCCESS_INDICATORS:
-                try:
-                    element = await self.page.query_selector(indicator)
-                    if element:
-                        self.logger.info(f"Successfully progressed to next step: {indicator}")
-                        return True
-                except:
-                    continue
+            try:
+                element = await self.page.query_selector(Selectors.SUCCESS_INDICATORS_CSS)
+                if element:
+                    self.logger.info("Successfully progressed to next step")
+                    return True
+            except:
+                pass
             
             current_url = self.page.url
             self.logger.info(f"Current URL after submission: {current_url}")
@@ -361,13 +351,12 @@ class ApplicationFormPage:
     async def _check_validation_errors(self) -> bool:
         """Check if there are validation errors on the form"""
         try:
-            for selector in Selectors.ERROR_MESSAGES:
-                errors = await self.page.query_selector_all(selector)
-                for error in errors:
-                    if await error.is_visible():
-                        error_text = await error.text_content()
-                        self.logger.error(f"Validation error found: {error_text}")
-                        return True
+            errors = await self.page.query_selector_all(Selectors.ERROR_MESSAGES_CSS)
+            for error in errors:
+                if await error.is_visible():
+                    error_text = await error.text_content()
+                    self.logger.error(f"Validation error found: {error_text}")
+                    return True
             return False
         except Exception as e:
             self.logger.error(f"Error checking validation: {e}")
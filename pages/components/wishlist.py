@@ -48,16 +48,13 @@ class WishlistComponent:
         self.logger.info("Waiting for wishlist panel to load...")
         
         try:
-            for selector in Selectors.WISHLIST_PANEL:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    element = await self.page.query_selector(selector)
-                    if element and await element.is_visible():
-                        await self.screenshot_manager.capture(self.page, "03b_wishlist_panel")
-                        self.logger.info(f"Wishlist panel found: {selector}")
-                        return True
-                except:
-                    continue
+            try:
+                await self.page.wait_for_selector(Selectors.WISHLIST_PANEL_CSS, state="visible", timeout=5000)
+                await self.screenshot_manager.capture(self.page, "03b_wishlist_panel")
+                self.logger.info("Wishlist panel found")
+                return True
+            except:
+                pass
             
             self.logger.warning("Wishlist panel not detected, but continuing...")
             return False
@@ -336,13 +336,12 @@ class HouseholdFormPage:
     async def _check_validation_errors(self) -> bool:
         """Check for validation errors"""
         try:
-            for selector in Selectors.ERROR_MESSAGES:
-                errors = await self.page.query_selector_all(selector)
-                for error in errors:
-                    if await error.is_visible():
-                        error_text = await error.text_content()
-                        self.logger.error(f"Validation error: {error_text}")
-                        return True
+            errors = await self.page.query_selector_all(Selectors.ERROR_MESSAGES_CSS)
+            for error in errors:
+                if await error.is_visible():
+                    error_text = await error.text_content()
+                    self.logger.error(f"Validation error: {error_text}")
+                    return True
             return False
         except Exception as e:
             self.logger.error(f"Error checking validation: {e}")
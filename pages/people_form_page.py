@@ -140,9 +140,7 @@ class PeopleFormPage:
         """
         self.logger.info("Looking for 'Add adult' button...")
         try:
-            add_adult_selector = "#create-new-adult"
-            
-            add_adult_button = self.page.locator(add_adult_selector)
+            add_adult_button = self.page.locator(Selectors.ADD_ADULT_BUTTON)
             await add_adult_button.wait_for(state="visible", timeout=TestConfig.DEFAULT_TIMEOUT)
 
             is_disabled = await add_adult_button.get_attribute("disabled")
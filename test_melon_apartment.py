@@ -5,7 +5,7 @@ from playwright.async_api import async_playwright, Page, Browser
 
 from config.test_config import TestConfig
 from data.factories import TestDataFactory
-from data.models import ApartmentDetails, TestResult
+from data.models import ApartmentDetails, FormData, TestResult
 from exceptions.test_exceptions import ApplicationFormError, NavigationError
 from pages.apartment_listing_page import ApartmentListingPage
 from pages.application_form_page import ApplicationFormPage
@@ -73,17 +73,17 @@ class TestCompleteApartmentWorkflow:
             result.execution_time = time.time() - start_time
             
             error_screenshot = await self.screenshot_manager.capture_error(page, "workflow")
-            result.screenshot_paths.append(error_screenshot)
+            result.add_screenshot(error_screenshot)
             
             print(f"\n Test failed with exception: {e}")
             raise
     
-    async def test_admin_verification_only(self, page: Page):
+    async def test_admin_verification_only(self, page: Page, family_data: list = None, form_data: FormData = None):
         """Test only the admin verification functionality (login + applications check)"""
         try:
             async with self.logger.log_phase("ADMIN VERIFICATION ONLY TEST"):
-                self.submitted_family_data = TestDataFactory.create_family_for_test_type("smoke")
-                self.submitted_form_data = TestDataFactory.create_realistic_applicant()
+                self.submitted_family_data = family_data or TestDataFactory.create_family_for_test_type("smoke")
+                self.submitted_form_data = form_data or TestDataFactory.create_realistic_applicant()
                 
                 self.logger.info(f"Testing verification for: {self.submitted_family_data[0].first_name} {self.submitted_family_data[0].last_name}")
                 self.logger.info(f"Email to search for: {self.submitted_family_data[0].email}")
@@ -552,7 +552,7 @@ async def test_complete_workflow_with_admin():
             await browser.close()
 
 @pytest.mark.asyncio 
-async def test_admin_verification_only():
+async def test_admin_verification_only(family_data, applicant_data):
     """Pytest function for testing only admin verification"""
     async with async_playwright() as p:
         browser = await p.chromium.launch(
@@ -564,7 +564,7 @@ async def test_admin_verification_only():
         test_suite = TestCompleteApartmentWorkflow()
         
         try:
-            await test_suite.test_admin_verification_only(page)
+            await test_suite.test_admin_verification_only(page, family_data, applicant_data)
         finally:
             await browser.close()
 
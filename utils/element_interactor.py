@@ -1,5 +1,5 @@
 from playwright.async_api import Page, ElementHandle
-from typing import List, Optional
+from typing import List, Optional, Sequence
 import asyncio
 
 from config.test_config import TestConfig
@@ -41,7 +41,7 @@ class ElementInteractor:
             self.logger.error(f"Failed to fill field {selector}: {e}")
             return False
     
-    async def find_visible_elements(self, selectors: List[str]) -> List[ElementHandle]:
+    async def find_visible_elements(self, selectors: Sequence[str]) -> List[ElementHandle]:
         """Find visible elements from a list of possible selectors"""
         for selector in selectors:
             try:
@@ -49,4 +49,12 @@ class TestLogger:
     
     def warning(self, message: str, **kwargs):
         print(f"   WARNING: {message}")
-        self.logger.warning(message, **kwargs)
\ No newline at end of file
+        self.logger.warning(message, **kwargs)
+    
+    def debug(self, message: str, **kwargs):
+        if self.is_debug_enabled():
+            print(f"   DEBUG: {message}")
+        self.logger.debug(message, **kwargs)
+    
+    def is_debug_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
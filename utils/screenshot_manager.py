@@ -9,7 +9,7 @@ class ScreenshotManager:
     
     def __init__(self, base_dir: Path = TestConfig.SCREENSHOT_DIR):
         self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(exist_ok=True)
+        self.base_dir.mkdir(parents=True, exist_ok=True)
     
     async def capture(self, page: Page, name: str, full_page: bool = False) -> str:
         """Capture screenshot with automatic naming"""